@@ -2,14 +2,62 @@
 """Get device list from YoLink local hub and display in table format"""
 
 import os
+import re
 import sys
 import json
 import argparse
+import asyncio
+import threading
+import time
+import ssl
+import urllib3
 import requests
-from datetime import datetime
-from urllib3.exceptions import InsecureRequestWarning
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
+from operator import itemgetter
+from urllib3.exceptions import HTTPError as Urllib3HTTPError, InsecureRequestWarning
 from tabulate import tabulate
 
+# Use orjson for faster JSON decoding and encoding when available
+try:
+    import orjson
+    json_loads = orjson.loads
+    JSON_DECODE_ERRORS = (json.JSONDecodeError, orjson.JSONDecodeError)
+    
+    def json_dumps_indented(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    orjson = None
+    json_loads = json.loads
+    JSON_DECODE_ERRORS = (json.JSONDecodeError,)
+    
+    def json_dumps_indented(obj):
+        return json.dumps(obj, indent=2)
+
+# Use simdjson for getState responses when available, so only the fields
+# we display are converted to Python objects
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+# Use httpx for getState calls when available, so they can be issued from one
+# event loop and multiplexed over a single HTTP/2 connection
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# Use ijson to stream large device lists, so getState calls can start
+# before the whole list has been received
+try:
+    import ijson
+    JSON_DECODE_ERRORS += (ijson.JSONError,)
+except ImportError:
+    ijson = None
+
 # Parse command-line arguments
 parser = argparse.ArgumentParser(
     description='Get device list from YoLink local hub and display in table format',
@@ -96,19 +144,44 @@ if missing:
     print("    Open YoLink app -> Select hub -> 'Local network' -> 'Integrations' tab", file=sys.stderr)
     sys.exit(1)
 
+# The hub uses a self-signed certificate, so skip verification (and its warning)
+# once here; also limit the handshake to TLS 1.2+ with AEAD ciphers
+urllib3.disable_warnings(InsecureRequestWarning)
+ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+ssl_context.check_hostname = False
+ssl_context.verify_mode = ssl.CERT_NONE
+ssl_context.minimum_version = ssl.TLSVersion.TLSv1_2
+ssl_context.set_ciphers('ECDHE+AESGCM:ECDHE+CHACHA20:AESGCM')
+
+class HubHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that uses the shared hub SSL context"""
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['ssl_context'] = ssl_context
+        return super().init_poolmanager(*args, **kwargs)
+    
+    def send(self, request, **kwargs):
+        # Session.verify = False alone is overridden by REQUESTS_CA_BUNDLE/CURL_CA_BUNDLE
+        kwargs['verify'] = False
+        return super().send(request, **kwargs)
+
+# Shared HTTP session so all calls reuse pooled TCP/TLS connections to the hub
+session = requests.Session()
+session.verify = False
+session.mount('https://', HubHTTPAdapter(pool_connections=32, pool_maxsize=32))
+session.mount('http://', HTTPAdapter(pool_connections=32, pool_maxsize=32))
+
 # Fetch token
 token_url = f"{yolink_url}/open/yolink/token"
 print(f"Fetching token from {token_url}...", file=sys.stderr)
 
 try:
-    token_response = requests.post(
+    token_response = session.post(
         token_url,
         data={
             'grant_type': 'client_credentials',
             'client_id': yolink_client_id,
             'client_secret': yolink_client_secret
         },
-        verify=False,
         timeout=10
     )
     token_response.raise_for_status()
@@ -126,54 +199,28 @@ except Exception as e:
     print(f"Error: Failed to fetch token: {e}", file=sys.stderr)
     sys.exit(1)
 
-api_url = f"{yolink_url}/open/yolink/v2/api"
-print(f"Fetching device list from {api_url}...")
-
-try:
-    response = requests.post(
-        api_url,
-        json={"method": "Home.getDeviceList"},
-        headers={
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {yolink_token}"
-        },
-        verify=False,
-        timeout=10
-    )
-    response.raise_for_status()
-    data = response.json()
-    
-except requests.exceptions.RequestException as e:
-    print(f"Error: Failed to fetch devices: {e}", file=sys.stderr)
-    sys.exit(1)
-except json.JSONDecodeError as e:
-    print(f"Error: Invalid JSON response: {e}", file=sys.stderr)
-    sys.exit(1)
-
-# Check for API errors
-code = data.get('code', '0')
-desc = data.get('desc', '')
-
-if code not in ['0', '000000']:
-    print(f"Error: {desc}", file=sys.stderr)
-    sys.exit(1)
-
-if any(keyword in desc.lower() for keyword in ['error', 'expired', 'invalid']):
-    print(f"Error: {desc}", file=sys.stderr)
-    sys.exit(1)
-
-# Extract device list
-devices = data.get('data', {}).get('devices', [])
+api_headers = {
+    "Content-Type": "application/json",
+    "Authorization": f"Bearer {yolink_token}"
+}
+session.headers.update(api_headers)
 
 # Function to extract model from appEui
+@lru_cache(maxsize=256)
 def get_model_from_appeui(appeui):
     """Extract model number from appEui (e.g., d88b4c7804000000 -> YS7804-UC)"""
-    if appeui and len(appeui) >= 10:
-        model_code = appeui[6:10]  # Extract characters 6-9
-        return f"YS{model_code}-UC"
-    return "N/A"
+    # Model code is characters 6-9
+    return f"YS{appeui[6:10]}-UC" if appeui and len(appeui) >= 10 else "N/A"
+
+# Human-readable names for device types without model-specific names
+DEVICE_TYPE_NAMES = {
+    'MotionSensor': 'Motion sensor',
+    'DoorSensor': 'Door sensor',
+    'LeakSensor': 'Leak sensor',
+}
 
 # Function to format device type
+@lru_cache(maxsize=128)
 def format_device_type(device_type, model=None):
     """Format device type with human-readable names"""
     # Special case for garage door sensors
@@ -189,12 +236,13 @@ def format_device_type(device_type, model=None):
         else:
             return 'Temperature sensor'
     
-    type_mapping = {
-        'MotionSensor': 'Motion sensor',
-        'DoorSensor': 'Door sensor',
-        'LeakSensor': 'Leak sensor',
-    }
-    return type_mapping.get(device_type, device_type)
+    return DEVICE_TYPE_NAMES.get(device_type, device_type)
+
+# Battery levels (0-4) as percentages
+BATTERY_PERCENT = {0: '0%', 1: '25%', 2: '50%', 3: '75%', 4: '100%'}
+
+# Temperature column for devices without a reading
+TEMPERATURE_NA = f"{'N/A':^7}"  # Center N/A in 7 chars
 
 # Function to format temperature with aligned C symbol (ASCII only)
 def format_temperature(temp_value, device_type):
@@ -204,7 +252,7 @@ def format_temperature(temp_value, device_type):
     Temps: right-aligned (  17  C)
     """
     if temp_value is None:
-        return f"{'N/A':^7}"  # Center N/A in 7 chars
+        return TEMPERATURE_NA
     
     if device_type == 'THSensor':
         # Temperature sensors: 1 decimal, right-align to 5 chars, then C directly
@@ -219,6 +267,32 @@ def format_temperature(temp_value, device_type):
     return f"{temp_str:>7}"  # Right-align in 7 chars
 
 
+# Function to get the local UTC offset at a given UTC time
+@lru_cache(maxsize=256)
+def local_utc_offset(year, month, day, hour, quarter):
+    """Local UTC offset in effect during the given 15-minute UTC slot
+    
+    DST transitions always fall on a quarter hour in UTC (e.g. 05:30 UTC in
+    St. John's), so the offset is constant within a slot and only has to be
+    resolved once per slot
+    """
+    return datetime(year, month, day, hour, quarter * 15, tzinfo=timezone.utc).astimezone().utcoffset()
+
+# Function to parse a hub UTC timestamp
+def parse_utc_timestamp(timestamp):
+    """Parse YYYY-MM-DDTHH:MM:SS[.sss]Z into a naive UTC datetime
+    
+    The hub always uses this layout, so slice the fields directly and only
+    fall back to fromisoformat() for anything else
+    """
+    if len(timestamp) >= 20 and timestamp[10] == 'T':
+        try:
+            return datetime(int(timestamp[0:4]), int(timestamp[5:7]), int(timestamp[8:10]),
+                            int(timestamp[11:13]), int(timestamp[14:16]), int(timestamp[17:19]))
+        except ValueError:
+            pass
+    return datetime.fromisoformat(timestamp[:-1])
+
 # Function to format reportAt timestamp
 def format_report_time(report_at_str):
     """Format ISO 8601 timestamp to local YYYY-MM-DD HH:MM:SS format (19 chars centered)
@@ -230,10 +304,13 @@ def format_report_time(report_at_str):
         return f"{'N/A':^19}"
     
     try:
-        # Parse ISO 8601 timestamp (UTC)
-        dt_utc = datetime.fromisoformat(report_at_str.replace('Z', '+00:00'))
-        # Convert to local timezone
-        dt_local = dt_utc.astimezone()
+        if report_at_str.endswith('Z'):
+            # Parse ISO 8601 timestamp (UTC) and shift by the cached local offset
+            dt_utc = parse_utc_timestamp(report_at_str)
+            dt_local = dt_utc + local_utc_offset(dt_utc.year, dt_utc.month, dt_utc.day, dt_utc.hour, dt_utc.minute // 15)
+        else:
+            # Other timezone suffixes: let astimezone() resolve the local time
+            dt_local = datetime.fromisoformat(report_at_str).astimezone()
         time_str = dt_local.strftime('%Y-%m-%d %H:%M:%S')
         # Center in 19 chars
         return f"{time_str:^19}"
@@ -242,58 +319,443 @@ def format_report_time(report_at_str):
 
 
 
+# State handlers, one per device type
+# Each takes (properties, model) and returns (state, nomotion, sensitivity, humidity)
+def format_motion_state(properties, model):
+    """Motion sensors: show the state (alert or off) plus delay and sensitivity"""
+    raw_state = properties.get('state', 'N/A')
+    if raw_state == 'alert':
+        state_str = 'motion detected'
+    elif raw_state in ('normal', 'off'):
+        state_str = 'no motion'
+    else:
+        state_str = raw_state.lower()
+    nomotion = str(properties.get('nomotionDelay', 'N/A'))
+    sensitivity = str(properties.get('sensitivity', 'N/A'))
+    return state_str, nomotion, sensitivity, 'N/A'
+
+def format_leak_state(properties, model):
+    """Leak sensors: show dry or wet"""
+    raw_state = properties.get('state', 'N/A')
+    if raw_state == 'alert':
+        state_str = 'wet'
+    elif raw_state in ('normal', 'off'):
+        state_str = 'dry'
+    else:
+        state_str = raw_state.lower()
+    return state_str, 'N/A', 'N/A', 'N/A'
+
+def format_th_state(properties, model):
+    """Temperature/humidity sensors: show the state, plus humidity on YS8003-UC"""
+    state_str = properties.get('state', 'N/A').lower()
+    humidity = 'N/A'
+    if model == 'YS8003-UC':
+        # Humidity sensors - extract humidity reading
+        humidity_val = properties.get('humidity', None)
+        if humidity_val is not None:
+            humidity = f'{humidity_val}%'
+    return state_str, 'N/A', 'N/A', humidity
+
+def format_default_state(properties, model):
+    """Other devices: show the state, or the first key-value pair"""
+    state_str = 'N/A'
+    if 'state' in properties:
+        state_str = properties['state'][:20].lower()
+    else:
+        # Show first key-value pair as state
+        first_key = next(iter(properties), None)
+        if first_key:
+            state_str = f"{first_key}: {str(properties[first_key])[:15]}".lower()
+    return state_str, 'N/A', 'N/A', 'N/A'
+
+STATE_HANDLERS = {
+    'MotionSensor': format_motion_state,
+    'LeakSensor': format_leak_state,
+    'THSensor': format_th_state,
+}
+
+# simdjson parsers are reused but not thread-safe, so keep one per worker thread
+json_parser_local = threading.local()
+
+# Function to parse a getState response, keeping only the fields we display
+def parse_state_response(content):
+    """Parse getState response with simdjson, extracting code, desc, state and reportAt
+    Returns: dict with the same layout as the full response
+    """
+    json_parser = getattr(json_parser_local, 'parser', None)
+    if json_parser is None:
+        json_parser = json_parser_local.parser = simdjson.Parser()
+    
+    doc = json_parser.parse(content)
+    result = {
+        'code': doc.get('code', '0'),
+        'desc': doc.get('desc', '')
+    }
+    data = doc.get('data')
+    if isinstance(data, simdjson.Object):
+        state = data.get('state')
+        result['data'] = {
+            'state': state.as_dict() if isinstance(state, simdjson.Object) else {},
+            'reportAt': data.get('reportAt')
+        }
+    return result
+
+# Function to stream devices out of a getDeviceList response body
+def stream_device_list(raw, header):
+    """Yield each device from a getDeviceList response as soon as it is parsed
+    Top-level code and desc are stored into header as they are seen
+    """
+    builder = None
+    for prefix, event, value in ijson.parse(raw):
+        if prefix in ('code', 'desc'):
+            header[prefix] = value
+        elif prefix == 'data.devices.item' and event == 'start_map':
+            builder = ijson.ObjectBuilder()
+        
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == 'data.devices.item' and event == 'end_map':
+                yield builder.value
+                builder = None
+
+# Function to build the getState request body for a device
+def build_state_request(device_id, device_token, device_type):
+    """Build the JSON body for a <type>.getState API call"""
+    return {
+        "method": f"{device_type}.getState",
+        "targetDevice": device_id,
+        "token": device_token,
+        "params": {}
+    }
+
+# Function to process a getState HTTP response
+def process_state_response(response):
+    """Validate and decode a getState response (requests or httpx)
+    Returns: (state_data, full_response) tuple
+    """
+    response.raise_for_status()
+    # The full response is only needed for --json output
+    if simdjson and not args.json:
+        result = parse_state_response(response.content)
+    else:
+        result = json_loads(response.content)
+    
+    return extract_state(result)
+
+# Function to extract state data from a decoded getState response
+def extract_state(result):
+    """Check a decoded getState response for API errors
+    Returns: (state_data, full_response) tuple
+    """
+    # Check for API errors
+    code = result.get('code', '0')
+    if code not in ['0', '000000']:
+        return None, result
+    
+    # Extract state data
+    state_data = result.get('data', {}).get('state', {})
+    return state_data, result
+
 # Function to get device properties
-def get_device_properties(device_id, device_token, device_type):
+def get_device_properties(device_id, device_token, device_type, session=session):
     """Get device state/properties from YoLink API
     Returns: (state_data, full_response) tuple
     """
     try:
-        method = f"{device_type}.getState"
-        response = requests.post(
+        response = session.post(
             api_url,
-            json={
-                "method": method,
-                "targetDevice": device_id,
-                "token": device_token,
-                "params": {}
-            },
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {yolink_token}"
-            },
-            verify=False,
+            json=build_state_request(device_id, device_token, device_type),
             timeout=10
         )
-        response.raise_for_status()
-        result = response.json()
-        
-        # Check for API errors
-        code = result.get('code', '0')
-        if code not in ['0', '000000']:
-            return None, result
-        
-        # Extract state data
-        state_data = result.get('data', {}).get('state', {})
-        return state_data, result
+        return process_state_response(response)
     except Exception as e:
         print(f"Warning: Could not fetch properties for {device_id}: {e}", file=sys.stderr)
         return None, None
 
+# Function to get device properties with an httpx.AsyncClient
+async def get_device_properties_async(device_id, device_token, device_type, client):
+    """Async variant of get_device_properties
+    Returns: (state_data, full_response) tuple
+    """
+    try:
+        response = await client.post(
+            api_url,
+            json=build_state_request(device_id, device_token, device_type)
+        )
+        return process_state_response(response)
+    except Exception as e:
+        print(f"Warning: Could not fetch properties for {device_id}: {e}", file=sys.stderr)
+        return None, None
+
+# Function to fetch properties for all devices from a single event loop
+async def fetch_all_properties_async(jobs):
+    """Issue all getState calls concurrently with asyncio.gather
+    Returns: list of (state_data, full_response) tuples in job order
+    """
+    client_args = {
+        'verify': ssl_context,
+        'timeout': 10,
+        'headers': api_headers,
+        'limits': httpx.Limits(max_connections=32)
+    }
+    try:
+        client = httpx.AsyncClient(http2=True, **client_args)
+    except ImportError:
+        # HTTP/2 support needs the optional h2 package
+        client = httpx.AsyncClient(**client_args)
+    
+    async with client:
+        return await asyncio.gather(*(get_device_properties_async(*job, client) for job in jobs))
+
+# File remembering, per hub URL, whether the hub accepts batched getState calls
+BATCH_SUPPORT_FILE = os.path.expanduser('~/.yolink_devices_batch.json')
+
+# Remembered rejections expire after a day, so a hub that only timed out
+# because it was slow or the network was busy gets probed again
+BATCH_REJECTION_MAX_AGE = 24 * 60 * 60
+
+# Function to load the remembered batch support for all hubs
+def load_batch_support():
+    """Read the batch support cache
+    Returns: dict of hub URL -> {'supported': bool, 'checked': epoch seconds}
+             (empty if missing or unreadable)
+    """
+    try:
+        with open(BATCH_SUPPORT_FILE) as f:
+            support = json.load(f)
+        return support if isinstance(support, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+# Function to check whether the batch probe should be sent to this hub
+def should_probe_batch(support):
+    """False only while this hub has an unexpired recorded rejection"""
+    entry = support.get(yolink_url)
+    if not isinstance(entry, dict) or entry.get('supported') is not False:
+        return True
+    checked = entry.get('checked')
+    if not isinstance(checked, (int, float)):
+        return True
+    return time.time() - checked >= BATCH_REJECTION_MAX_AGE
+
+# Function to remember whether this hub accepts batched getState calls
+def save_batch_support(support, supported):
+    """Record batch support for this hub, ignoring write errors
+    Nothing is written if supported is None or the hub is already recorded as
+    supported; rejections are always written, since they are only probed for
+    when missing or expired
+    """
+    if supported is None:
+        return
+    entry = support.get(yolink_url)
+    if supported and isinstance(entry, dict) and entry.get('supported') is True:
+        return
+    support[yolink_url] = {'supported': supported, 'checked': int(time.time())}
+    try:
+        with open(BATCH_SUPPORT_FILE, 'w') as f:
+            json.dump(support, f)
+    except OSError:
+        pass
+
+# Short timeout for the batch probe, so a hub that hangs on array bodies
+# doesn't hold up the per-device fallback for long
+BATCH_PROBE_TIMEOUT = 3
+
+# Auth, timeout and throttling statuses say nothing about batch support
+BATCH_PROBE_TRANSIENT_STATUSES = (401, 403, 408, 429)
+
+# Function to find which batch job a reply belongs to
+def match_batch_reply(reply, job_count, device_index):
+    """Match a batch reply by echoed id, or by the device ID it reports
+    device_index maps device ID -> job index (None for IDs shared by several jobs)
+    Returns: index into jobs, or None if the reply can't be matched
+    """
+    reply_id = reply.get('id')
+    if isinstance(reply_id, int) and 0 <= reply_id < job_count:
+        return reply_id
+    
+    data = reply.get('data')
+    device_id = (data.get('deviceId') if isinstance(data, dict) else None) or reply.get('targetDevice')
+    return device_index.get(device_id)
+
+# Function to fetch properties for all devices in a single request
+def fetch_all_properties_batch(jobs):
+    """Send all getState calls as one JSON-RPC style array body
+    Returns: (results, supported) tuple
+        results: list of (state_data, full_response) tuples in job order,
+                 or None if the hub did not answer with a matching array
+        supported: True/False when the answer shows whether batching works,
+                   None when it is inconclusive (HTTP error, bad JSON, ...)
+    """
+    body = [dict(build_state_request(*job), id=index) for index, job in enumerate(jobs)]
+    try:
+        response = session.post(api_url, json=body, timeout=BATCH_PROBE_TIMEOUT)
+    except requests.exceptions.ReadTimeout:
+        # Hub accepted the connection but never answered the array body; the
+        # rejection this records expires after BATCH_REJECTION_MAX_AGE
+        return None, False
+    if response.status_code in BATCH_PROBE_TRANSIENT_STATUSES or response.status_code >= 500:
+        # e.g. 401 from an expired token or 5xx while the hub restarts
+        return None, None
+    if not response.ok:
+        # Any other client error (400, 415, 422, ...) is the hub refusing the array body
+        return None, False
+    try:
+        replies = json_loads(response.content)
+    except JSON_DECODE_ERRORS:
+        return None, None
+    if isinstance(replies, dict):
+        # Well-formed single-object answer (typically an API error): no batching
+        return None, False
+    if not isinstance(replies, list) or len(replies) != len(jobs):
+        return None, None
+    if not all(isinstance(reply, dict) for reply in replies):
+        return None, None
+    
+    # Batch replies may come back in any order, so every reply has to be matched
+    # to its job; if any can't be, the answer is unusable
+    # Devices without a deviceId all share 'N/A', so those can only match by id
+    device_index = {}
+    for index, job in enumerate(jobs):
+        device_index[job[0]] = None if job[0] in device_index else index
+    
+    ordered = [None] * len(jobs)
+    for reply in replies:
+        index = match_batch_reply(reply, len(jobs), device_index)
+        if index is None or ordered[index] is not None:
+            return None, None
+        ordered[index] = reply
+    
+    # Handle each reply like the per-device path does, so a malformed one only
+    # costs that device its properties
+    results = []
+    for job, reply in zip(jobs, ordered):
+        try:
+            results.append(extract_state(reply))
+        except Exception as e:
+            print(f"Warning: Could not fetch properties for {job[0]}: {e}", file=sys.stderr)
+            results.append((None, None))
+    return results, True
+
+api_url = f"{yolink_url}/open/yolink/v2/api"
+print(f"Fetching device list from {api_url}...")
+
+# getState dispatch strategy, by installed optional packages:
+#   ijson without httpx: stream the device list and submit each device's getState
+#       to a thread pool while the list is still being parsed; no batch attempt
+#   anything else: parse the whole list, then try one batched getState request
+#       (unless this hub is known to reject it), falling back to per-device calls
+#       with asyncio.gather on httpx.AsyncClient if httpx is installed, or a
+#       thread pool over the requests session if not
+stream_executor = None
+device_futures = {}
+try:
+    if ijson and not httpx:
+        # Stream the device list and start each getState call on the thread pool
+        # as soon as its device has been parsed
+        response = session.post(
+            api_url,
+            json={"method": "Home.getDeviceList"},
+            timeout=10,
+            stream=True
+        )
+        response.raise_for_status()
+        response.raw.decode_content = True
+        stream_executor = ThreadPoolExecutor(max_workers=32)
+        header = {}
+        devices = []
+        for device in stream_device_list(response.raw, header):
+            devices.append(device)
+            if device.get('token'):
+                device_id = device.get('deviceId', 'N/A')
+                device_futures[device_id] = stream_executor.submit(
+                    get_device_properties, device_id, device['token'], device.get('type', 'N/A'))
+        data = {
+            'code': header.get('code', '0'),
+            'desc': header.get('desc', ''),
+            'data': {'devices': devices}
+        }
+    else:
+        response = session.post(
+            api_url,
+            json={"method": "Home.getDeviceList"},
+            timeout=10
+        )
+        response.raise_for_status()
+        data = json_loads(response.content)
+    
+except (requests.exceptions.RequestException, Urllib3HTTPError) as e:
+    print(f"Error: Failed to fetch devices: {e}", file=sys.stderr)
+    sys.exit(1)
+except JSON_DECODE_ERRORS as e:
+    print(f"Error: Invalid JSON response: {e}", file=sys.stderr)
+    sys.exit(1)
+
+# Check for API errors
+ERROR_DESC_RE = re.compile(r'error|expired|invalid', re.IGNORECASE)
+code = data.get('code', '0')
+desc = data.get('desc', '')
+
+if code not in ['0', '000000']:
+    print(f"Error: {desc}", file=sys.stderr)
+    sys.exit(1)
+
+if ERROR_DESC_RE.search(desc):
+    print(f"Error: {desc}", file=sys.stderr)
+    sys.exit(1)
+
+# Extract device list
+devices = data.get('data', {}).get('devices', [])
+
+# Fetch properties for all devices with a token concurrently (see the dispatch
+# strategy above). Each getState call is a network round-trip to the hub, so overlap them
+jobs = [(d.get('deviceId', 'N/A'), d['token'], d.get('type', 'N/A')) for d in devices if d.get('token')]
+device_results = {}
+if stream_executor:
+    # Already dispatched while streaming the device list
+    device_results = {device_id: future.result() for device_id, future in device_futures.items()}
+    stream_executor.shutdown()
+elif jobs:
+    # Try a single batched request unless this hub is known to reject it
+    results = None
+    batch_support = load_batch_support()
+    if should_probe_batch(batch_support):
+        try:
+            results, supported = fetch_all_properties_batch(jobs)
+            save_batch_support(batch_support, supported)
+        except requests.exceptions.RequestException:
+            # Network problem rather than a rejection, so don't record anything
+            pass
+    
+    # Otherwise fall back to one concurrent getState call per device
+    if results is None and httpx:
+        results = asyncio.run(fetch_all_properties_async(jobs))
+    elif results is None:
+        with ThreadPoolExecutor(max_workers=min(32, len(jobs))) as executor:
+            results = list(executor.map(lambda job: get_device_properties(*job), jobs))
+    device_results = {job[0]: result for job, result in zip(jobs, results)}
+
+# Row format strings, bound once so each row skips f-string parsing
+# The hide-id variant skips field 2 (Device ID) so both take the same row
+FULL_ROW_FMT = "{0:<32} {1:<35} {2:<18} {3:<10} {4:>8} {5:>7} {6:>9} {7:^19} {8:^10} {9:^11} {10:^16} {11:^8}\n".format
+HIDE_ID_ROW_FMT = "{0:<32} {1:<35} {3:<10} {4:>8} {5:>7} {6:>9} {7:^19} {8:^10} {9:^11} {10:^16} {11:^8}\n".format
+
 # Print table
 print()
-table_data = []
+table_data = [None] * len(devices)
 json_responses = []  # Store JSON responses for --json output
 headers = ['Type', 'Name', 'Device ID', 'Model', 'Battery', 'Temp', 'No motion delay', 'Sensitivity', 'State', 'Version']
 
 if not devices:
     print("No devices found")
 else:
-    for device in devices:
-        device_id = device.get('deviceId', 'N/A')
-        device_name = device.get('name', 'N/A')
-        device_type = device.get('type', 'N/A')
-        device_token = device.get('token', '')
-        appeui = device.get('appEui', '')
+    for index, device in enumerate(devices):
+        device_get = device.get  # Bind once for the lookups below
+        device_id = device_get('deviceId', 'N/A')
+        device_name = device_get('name', 'N/A')
+        device_type = device_get('type', 'N/A')
+        device_token = device_get('token', '')
+        appeui = device_get('appEui', '')
         model = get_model_from_appeui(appeui)
         
         # Get device properties
@@ -306,7 +768,7 @@ else:
         sensitivity = 'N/A'
         report_time = f"{'N/A':^19}"
         if device_token:
-            properties, device_json_response = get_device_properties(device_id, device_token, device_type)
+            properties, device_json_response = device_results[device_id]
             if device_json_response:
                 json_responses.append({
                     'deviceId': device_id,
@@ -321,8 +783,8 @@ else:
                 
                 # Extract battery level (0-4 maps to 0-100%)
                 if 'battery' in properties:
-                    battery_level = int((properties['battery'] / 4) * 100)
-                    battery = f"{battery_level}%"
+                    battery_level = properties['battery']
+                    battery = BATTERY_PERCENT.get(battery_level) or f"{int((battery_level / 4) * 100)}%"
                 # Extract temperature (devTemperature is the source of truth)
                 temp_value = None
                 if 'devTemperature' in properties:
@@ -338,78 +800,46 @@ else:
                     version = properties['version']
                 
                 # Extract state info based on device type
-                if device_type == 'MotionSensor':
-                    # For motion sensors, show the state (alert or off)
-                    raw_state = properties.get('state', 'N/A')
-                    if raw_state == 'alert':
-                        state_str = 'motion detected'
-                    elif raw_state in ['normal', 'off']:
-                        state_str = 'no motion'
-                    else:
-                        state_str = raw_state.lower()
-                    nomotion = str(properties.get('nomotionDelay', 'N/A'))
-                    sensitivity = str(properties.get('sensitivity', 'N/A'))
-                elif device_type == 'LeakSensor':
-                    # For leak sensors, show dry or wet
-                    raw_state = properties.get('state', 'N/A')
-                    if raw_state == 'alert':
-                        state_str = 'wet'
-                    elif raw_state in ['normal', 'off']:
-                        state_str = 'dry'
-                    else:
-                        state_str = raw_state.lower()
-                elif device_type == 'THSensor':
-                    # For temperature/humidity sensors
-                    raw_state = properties.get('state', 'N/A')
-                    state_str = raw_state.lower()
-                    
-                    if model == 'YS8003-UC':
-                        # Humidity sensors - extract humidity reading
-                        humidity_val = properties.get('humidity', None)
-                        if humidity_val is not None:
-                            humidity = f'{humidity_val}%'
-                        # else humidity stays as 'N/A' from initialization
-                elif 'state' in properties:
-                    state_str = properties['state'][:20].lower()
-                elif properties:
-                    # Show first key-value pair as state
-                    first_key = next(iter(properties), None)
-                    if first_key:
-                        state_str = f"{first_key}: {str(properties[first_key])[:15]}".lower()
+                state_handler = STATE_HANDLERS.get(device_type, format_default_state)
+                state_str, nomotion, sensitivity, humidity = state_handler(properties, model)
         
         # Format temperature if not already formatted (N/A case)
         if temperature is None:
-            temperature = format_temperature(None, device_type)
+            temperature = TEMPERATURE_NA
         
-        table_data.append([format_device_type(device_type, model), device_name, device_id, model, battery, temperature, humidity, report_time, nomotion, sensitivity, state_str, version])
-    
-    # Print header with wrapped "No motion delay" and "Last radio contact" (3 lines, centered)
-    if args.hide_device_id:
-        print(f"{'Type':<32} {'Name':<35} {'Model':<10} {'Battery':>8} {'Temp':>7} {'Humidity':>9} {'Last':^19} {'No':^10} {'Sensitivity':^11} {'State':^16} {'Version':^8}")
-        print(f"{'':<32} {'':<35} {'':<10} {'':<8} {'':<7} {'':<9} {'radio':^19} {'motion':^10} {'':<11} {'':<16} {'':<8}")
-        print(f"{'':<32} {'':<35} {'':<10} {'':<8} {'':<7} {'':<9} {'contact':^19} {'delay':^10} {'':<11} {'':<16} {'':<8}")
-        print("-" * 194)
-    else:
-        print(f"{'Type':<32} {'Name':<35} {'Device ID':<18} {'Model':<10} {'Battery':>8} {'Temp':>7} {'Humidity':>9} {'Last':^19} {'No':^10} {'Sensitivity':^11} {'State':^16} {'Version':^8}")
-        print(f"{'':<32} {'':<35} {'':<18} {'':<10} {'':<8} {'':<7} {'':<9} {'radio':^19} {'motion':^10} {'':<11} {'':<16} {'':<8}")
-        print(f"{'':<32} {'':<35} {'':<18} {'':<10} {'':<8} {'':<7} {'':<9} {'contact':^19} {'delay':^10} {'':<11} {'':<16} {'':<8}")
-        print("-" * 212)
+        table_data[index] = (format_device_type(device_type, model), device_name, device_id, model, battery, temperature, humidity, report_time, nomotion, sensitivity, state_str, version)
     
     # Sort by device type, then by name (or by contact time if requested)
     if args.sort_by_contact:
         # Sort by Last radio contact (oldest first), then Type, then Name
-        # Strip whitespace from centered timestamp for proper sorting
-        table_data.sort(key=lambda row: (row[7].strip(), row[0], row[1]))
+        # Two stable passes: Type/Name first, then the stripped centered timestamp
+        table_data.sort(key=itemgetter(0, 1))
+        table_data.sort(key=lambda row: row[7].strip())
     else:
         # Default: Sort by Type, then Name
-        table_data.sort(key=lambda row: (row[0], row[1]))
+        table_data.sort(key=itemgetter(0, 1))
     
-    # Print rows with proper alignment
-    for row in table_data:
-        if args.hide_device_id:
-            print(f"{row[0]:<32} {row[1]:<35} {row[3]:<10} {row[4]:>8} {row[5]:>7} {row[6]:>9} {row[7]:^19} {row[8]:^10} {row[9]:^11} {row[10]:^16} {row[11]:^8}")
-        else:
-            print(f"{row[0]:<32} {row[1]:<35} {row[2]:<18} {row[3]:<10} {row[4]:>8} {row[5]:>7} {row[6]:>9} {row[7]:^19} {row[8]:^10} {row[9]:^11} {row[10]:^16} {row[11]:^8}")
+    row_fmt = HIDE_ID_ROW_FMT if args.hide_device_id else FULL_ROW_FMT
+    
+    # Header with wrapped "No motion delay" and "Last radio contact" (3 lines, centered)
+    output = [
+        row_fmt('Type', 'Name', 'Device ID', 'Model', 'Battery', 'Temp', 'Humidity', 'Last', 'No', 'Sensitivity', 'State', 'Version'),
+        row_fmt('', '', '', '', '', '', '', 'radio', 'motion', '', '', ''),
+        row_fmt('', '', '', '', '', '', '', 'contact', 'delay', '', '', ''),
+        "-" * (194 if args.hide_device_id else 212) + "\n"
+    ]
+    # Rows with proper alignment
+    output.extend(row_fmt(*row) for row in table_data)
+    
+    # Print the whole table with a single write, straight to the binary buffer
+    # when there is one so the text layer doesn't re-encode it
+    table_text = "".join(output)
+    stdout_buffer = getattr(sys.stdout, 'buffer', None)
+    if stdout_buffer:
+        sys.stdout.flush()  # Keep earlier text output ahead of the table
+        stdout_buffer.write(table_text.encode(sys.stdout.encoding, sys.stdout.errors))
+    else:
+        sys.stdout.write(table_text)
 
 # Output JSON responses if requested
 if args.json and json_responses:
@@ -419,7 +849,7 @@ if args.json and json_responses:
     for entry in json_responses:
         print(f"Device: {entry['name']} ({entry['deviceId']})")
         print("-" * 80)
-        print(json.dumps(entry['response'], indent=2))
+        print(json_dumps_indented(entry['response']))
         print()
 
 sys.exit(0)